@@ -8,7 +8,10 @@ Olga Yanovskaya
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from functools import lru_cache
+from itertools import islice
 from platform import system
 from tkinter import Tk, Text, NW, LEFT, StringVar, TclError
 from tkinter.ttk import Frame, Button, Label
@@ -18,8 +21,8 @@ import config
 import rusmarc
 
 regex_ozboz = re.compile(r'.+?(?= [/:;]|$)', re.IGNORECASE)
-regex_heading = re.compile(r'^([\w]+?),? ((?:[\w{1,2}]\. ){1,2})(.+)')
-regex_publ = re.compile(r'([^:]*?)(?: ?: (.*?))?, (\d{4})')
+regex_heading = re.compile(r'^([^\s,.]+),? ((?:\w{1,2}\. ){1,2})(.+)')
+regex_publ = re.compile(r'\A([^:,]*?)(?: ?: (.*?))?, (\d{4})(?!\d)')
 regex_m_pages = re.compile(r'^(\d+) ([сcpSsл]\.?)')
 regex_s_pages = re.compile(r'^([CСPS]\.) ?(\d+\D{1,3}\d+)')
 regex_edition = re.compile(r'^\d{1,2}(?=-е из).+')
@@ -27,6 +30,21 @@ regex_issue = re.compile(
     r'''((?:issue|no\.|v(?:\.|ol(?:\.|ume))|вып(?:\.|уск)|
 выпуск №|т(?:\.|ом\.?)|ч(?:\.|асть)|№){1,2} ?[-(),/\d IVXDC]+)''',
     re.IGNORECASE)
+regex_multispace = re.compile(r' {2,}')
+regex_isbd_split = re.compile(r'( // )|\. - ')
+# all description area patterns in one pass, dispatched on m.lastgroup
+# pages go before year, or '1024 с.' would be taken for a year
+regex_area = re.compile('|'.join(
+    f'(?P<{name}>{pattern})'
+    for name, pattern in (('edn', r'^EDN.(.{0,6})'),
+                          ('isbn', r'^ISBN.(.*)'),
+                          ('doi', r'^DOI.(.*)'),
+                          ('publ', regex_publ.pattern),
+                          ('m_pages', regex_m_pages.pattern),
+                          ('s_pages', regex_s_pages.pattern),
+                          ('year', r'^\d{4}'),
+                          ('edition', regex_edition.pattern),
+                          ('issue', f'(?i:{regex_issue.pattern})'))))
 
 if system() == 'Linux':
     app_dir = config.linux_app_dir
@@ -38,17 +56,30 @@ else:
     app_dir = ''
     irbiswrk_dir = ''
 today = date.today().strftime('%Y%m%d')
+batch_size = 256  # lines of a file sent to worker processes at a time
 dashes = str.maketrans('–—―‒−', '-----')
 noyo = str.maketrans('Ёё', 'Ее')
-irbis_entry = {}
+dashes_noyo = {**dashes, **noyo}
+publ_codes_asp = ('463^d', '463^g', '463^j')
+publ_codes_mono = ('210^a', '210^c', '210^d')
+pages_codes_asp = ('463^1', '463^s')
+pages_codes_mono = ('215^a', '215^1')
+no_publ = ('б. м.', 'б. и.', 'б. г.')
+cyr_first, cyr_last = '\u0400', '\u04FF'
+title_parts = {
+    ' : ': 'title_info',
+    ' / ': 'resp_stmt_1',
+    ' ; ': 'resp_stmt_2'
+}
 parsing_batch = []
-place = ()
 
 
 class Field:
     """Irbis field
     attributes:
         tag - field tag
+        parsing - the Parsing the field belongs to, its place tells fill()
+            which occ. and subfield to fill
         contents - a list of dictionaries:
             occ. no. is the index ([0] is all occs. together)
             subfield tag is the key of the dictionary
@@ -57,32 +88,27 @@ class Field:
             subf_list == contents[0]
     """
 
-    def __init__(self, tag: int):
-        """Makes an empty field object."""
+    def __init__(self, tag: int, parsing):
+        """Makes an empty field object in parsing.fields."""
         self.tag = tag
+        self.parsing = parsing
         self.contents = [{}]
         self.subf_list = self.contents[0]
-        irbis_entry[self.tag] = self
+        parsing.fields[self.tag] = self
 
     def fill(self, value):
         """Fills fields with values.
         Updates subfield value lists in self.contents[0]."""
-        global place
-        v_occ, v_subf = place[1:3]
-        o = len(self.contents)
-        while o < v_occ + 1:
+        v_occ, v_subf = self.parsing.place[1:3]
+        while len(self.contents) < v_occ + 1:
             self.contents.append({})
-            o = len(self.contents)
+            for values in self.subf_list.values():
+                values.append(None)
         if value:
             self.contents[v_occ][v_subf] = value
-        kk = set()
-        for o in self.contents:
-            kk.update(o.keys())
-        for key in kk:
-            self.subf_list[key] = []
-            for i, o in enumerate(self.contents):
-                if i != 0:
-                    self.subf_list[key].append(o.get(key))
+            if v_subf not in self.subf_list:
+                self.subf_list[v_subf] = [None] * (len(self.contents) - 1)
+            self.subf_list[v_subf][v_occ - 1] = value
 
     def show(self, pft=None):
         """Turns field object to string for printing or writing to file.
@@ -91,7 +117,7 @@ class Field:
 
         'pft' attribute defines printing format:
             'allpft' - imitates all.pft
-            'irbistext' - makes text file for importing
+            'irbistext' - makes text file for importing, skips empty occs.
         """
         if pft == 'irbistext':
             tag_form = f'#{self.tag}: '
@@ -101,6 +127,8 @@ class Field:
                                     self.contents[1:]):
             if pft == 'allpft':
                 tag_form = f'#{self.tag}/{occ_no}:_'
+            elif pft == 'irbistext' and not occ_text:
+                continue
             if '_' in occ_text:
                 yield f'{tag_form}{str(occ_text["_"])}'
             else:
@@ -112,129 +140,142 @@ class Parsing:
 
     def __init__(self, bibref):
 
-        bibref = bibref.strip(' \r\n\t')
-        while '  ' in bibref:
-            bibref = bibref.replace('  ', ' ')
-        bibref = bibref.translate(dashes)
-        bibref = bibref.replace('.- ', '. - ')
-        bibref = bibref.translate(noyo)
-
-        single_work, _, source = bibref.partition(r' // ')
-        self.asp = bool(source)
-        ozboz, *desc_areas = single_work.split('. - ')
+        bibref = clean_bibref(bibref)
+        self.bibref = bibref
+        self.latin_names = False
+        self.fields = {}
+        self.place = ()
+
+        # areas alternate with separators: ' // ' or None for '. - '
+        areas = regex_isbd_split.split(bibref)
+        k = areas.index(' // ') if ' // ' in areas else len(areas)
+        source = areas[k + 1::2]
+        self.asp = any(source)
+        ozboz, *desc_areas = areas[:k:2]
         title, title_info, resp_stmt_1, resp_stmt_2 = self.make_title(ozboz)
-        fld('200^a').fill(title)
-        fld('200^e').fill(title_info)
-        fld('200^f').fill(resp_stmt_1)
-        fld('200^g').fill(resp_stmt_2)
+        self.fld('200^a').fill(title)
+        self.fld('200^e').fill(title_info)
+        self.fld('200^f').fill(resp_stmt_1)
+        self.fld('200^g').fill(resp_stmt_2)
         self.make_author(701, resp_stmt_1)
         if resp_stmt_2:
             self.make_author(702, resp_stmt_2)
 
         if self.asp:
-            s_ozboz, *larger_coll = source.split('. - ')
+            s_ozboz, *larger_coll = source
             (s_title, s_title_info, s_resp_stmt_1,
              s_resp_stmt_2) = self.make_title(s_ozboz)
             if s_resp_stmt_1:
                 self.make_author(961, s_resp_stmt_1)
             if s_resp_stmt_2:
                 self.make_author(961, s_resp_stmt_2)
-            fld('463^c').fill(s_title)
-            fld('963^e').fill(s_title_info)
+            self.fld('463^c').fill(s_title)
+            self.fld('963^e').fill(s_title_info)
             if 'конференц' in s_title_info:
-                fld('900^c').fill('18f')
+                self.fld('900^c').fill('18f')
             if s_resp_stmt_1:
                 if s_resp_stmt_2:
-                    fld('963^f').fill(f'{s_resp_stmt_1} ; {s_resp_stmt_2}')
+                    self.fld('963^f').fill(
+                        f'{s_resp_stmt_1} ; {s_resp_stmt_2}')
                 else:
-                    fld('963^f').fill(s_resp_stmt_1)
+                    self.fld('963^f').fill(s_resp_stmt_1)
             desc_areas += larger_coll
 
         for area in desc_areas:
-            publ = re.search(regex_publ, area)
-            if type(publ) is re.Match:
-                publ_info = publ.groups()
-                fno, s = (463, 'dgj') if self.asp else (210, 'acd')
-                no_publ = ('б. м.', 'б. и.', 'б. г.')
-                for j in range(3):
-                    fld(f'{fno}^{s[j]}').fill(
-                        publ_info[j] if publ_info[j] else no_publ[j])
-
-            year = re.match(r'\d{4}', area)
-            if type(year) is re.Match:
-                fld('463^j').fill(year[0])
-                fld('900^b').fill('08')
-            elif self.asp:
-                fld('900^b').fill('09')
-            elif not self.asp:
-                fld('900^b').fill('05')
-
-            pages_regex = regex_s_pages if self.asp else regex_m_pages
-            pages = re.search(pages_regex, area)
-            if type(pages) is re.Match:
-                fno, st = (463, '1s') if self.asp else (215, 'a1')
-                for j in range(2):
-                    fld(f'{fno}^{st[j]}').fill(pages[j + 1])
-
-            ed_area = re.search(regex_edition, area)
-            if type(ed_area) is re.Match:
-                ed_info = ed_area.group().split(', ')
-                for s, val in zip('ab', ed_info):
-                    fld(f'205^{s}').fill(val)
-
-            issue = [
-                elem.rstrip(', ') for elem in re.findall(regex_issue, area)
-            ]
-            for s, val in zip('vil', issue):
-                fld(f'463^{s}').fill(val)
-
-            if area.startswith('EDN'):
-                for s, val in zip(
-                        'tih',
-                    ('Ссылка на публикацию',
-                     f'https://elibrary.ru/item.asp?edn={area[4:10]}', '05')):
-                    fld(f'951^{s}').fill(val)
-
-            if area.startswith('ISBN'):
-                code = ('961^i') if self.asp else ('10^a')
-                fld(code).fill(area[5:])
-
-            if area.startswith('DOI'):
-                fld('19^A').fill('6 DOI')
-                fld('19^B').fill(area[4:])
-
-        fld('920').fill('ASP' if self.asp else 'PAZK')
+            year = status_filled = False
+            issue_subf = iter('vil')
+            for m in regex_area.finditer(area):
+                kind = m.lastgroup
+                g = regex_area.groupindex[kind]
+                # publ and year can only be the first match of an area,
+                # 900 goes right after them as it always has
+                if not status_filled and kind not in ('publ', 'year'):
+                    self.fill_status(year)
+                    status_filled = True
+                if kind == 'publ':
+                    codes = publ_codes_asp if self.asp else publ_codes_mono
+                    for code, val, default in zip(
+                            codes, m.group(g + 1, g + 2, g + 3), no_publ):
+                        self.fld(code).fill(val or default)
+                elif kind == 'year':
+                    year = True
+                    self.fld('463^j').fill(m[kind])
+                elif kind == ('s_pages' if self.asp else 'm_pages'):
+                    codes = pages_codes_asp if self.asp else pages_codes_mono
+                    for code, val in zip(codes, m.group(g + 1, g + 2)):
+                        self.fld(code).fill(val)
+                elif kind == 'edition':
+                    ed_info = m[kind].split(', ')
+                    for s, val in zip('ab', ed_info):
+                        self.fld(f'205^{s}').fill(val)
+                elif kind == 'issue':
+                    s = next(issue_subf, None)
+                    if s:
+                        self.fld(f'463^{s}').fill(m[kind].rstrip(', '))
+                elif kind == 'edn':
+                    url = f'https://elibrary.ru/item.asp?edn={m[g + 1]}'
+                    for s, val in zip(
+                            'tih', ('Ссылка на публикацию', url, '05')):
+                        self.fld(f'951^{s}').fill(val)
+                elif kind == 'isbn':
+                    code = ('961^i') if self.asp else ('10^a')
+                    self.fld(code).fill(m[g + 1])
+                elif kind == 'doi':
+                    self.fld('19^A').fill('6 DOI')
+                    self.fld('19^B').fill(m[g + 1])
+            if not status_filled:
+                self.fill_status(year)
+
+        self.fld('920').fill('ASP' if self.asp else 'PAZK')
         for s, val in zip('cab', ('ПК', today, 'itfmaker')):
-            fld(f'907^{s}').fill(val)
-
-        self.fields = irbis_entry.copy()
-        irbis_entry.clear()
-        parsing_batch.append(self)
-
-        print(f'*****\n\n{bibref}\n\n')
+            self.fld(f'907^{s}').fill(val)
+
+    def fill_status(self, year):
+        """fill 900^b for an area: '08' if it is a year, else by type"""
+        self.fld('900^b').fill('08' if year else ('09' if self.asp else '05'))
+
+    def fld(self, code):
+        """get or create a field object by an IRBIS-like designation
+        code is TAG^SUBF#OCC, like &uf('av900^A#1') in Irbis
+        self.place stores position in fields to communicate it to Field.fill
+        #n makes new occurrences (does not work well: makes a new occ for
+        every subfield, use for fields with no subfields only, like 610)
+        """
+        v_tag, v_subf, v_occ = parse_code(code)
+        field = self.fields.get(v_tag) or Field(v_tag, self)
+        if v_occ == 'n':
+            v_occ = len(field.contents)
+        self.place = v_tag, v_occ, v_subf
+        return field
+
+    def show(self):
+        """print the bib.ref. and its fields like all.pft"""
+        print(f'*****\n\n{self.bibref}\n\n')
         for field in self.fields.values():
             print(*field.show('allpft'), sep='\n')
 
     def make_title(self, area):
-        ozboz = re.findall(regex_ozboz, area)
+        ozboz = regex_ozboz.finditer(area)
+        first = next(ozboz, None)
+        if first is None:
+            raise IndexError('empty title area')  # do_parsing: nothing to do
         title, title_info, resp_stmt_1, resp_stmt_2, heading = (
             '' for x in range(5))
-        if z := re.match(regex_heading, ozboz[0]):
+        if (z := regex_heading.match(first[0])) is not None:
             title = z[3]
-            fld('700^a').fill(z[1])
-            fld('700^b').fill(z[2].strip())
+            self.fld('700^a').fill(z[1])
+            self.fld('700^b').fill(z[2].strip())
         else:
-            title = ozboz[0]
-        for elem in ozboz[1:]:
-            if elem.startswith(' : '):
-                title_info = elem[3:].replace(elem[3], elem[3].lower())
-                continue
-            elif elem.startswith(' / '):
+            title = first[0]
+        for m in ozboz:
+            elem = m[0]
+            kind = title_parts.get(elem[:3])
+            if kind == 'title_info':
+                title_info = elem[3:].replace(elem[3], elem[3].lower(), 1)
+            elif kind == 'resp_stmt_1':
                 resp_stmt_1 = elem[3:]
-                continue
-            elif elem.startswith(' ; '):
+            elif kind == 'resp_stmt_2':
                 resp_stmt_2 = elem[3:]
-                continue
         return title, title_info, resp_stmt_1, resp_stmt_2
 
     def make_author(self, fno, resp_stmt):
@@ -242,28 +283,33 @@ class Parsing:
             resp_stmt = resp_stmt[:-8]
         people = resp_stmt.split(', ')
         for i, person in enumerate(people):
-            if not bool(re.search('[\u0400-\u04FF]', person)):
-                notify_text.set('Имена латиницей, нужно будет исправить.')
-
-            nameparts = person.split()
-            famname = ' '.join(
-                [n for n in nameparts if '.' not in n and n[0].isupper()])
-            io = ' '.join(
-                [n for n in nameparts if '.' in n and n[0].isupper()])
-            ed_func = ' '.join(
-                [n for n in nameparts if n not in famname and n[0].islower()])
-
-            fld(f'{fno}^a#{i+1}').fill(famname)
-            fld(f'{fno}^b#{i+1}').fill(io)
+            if not any(cyr_first <= c <= cyr_last for c in person):
+                self.latin_names = True
+
+            famname, io, ed_func = [], [], []
+            for n in person.split():
+                if n[0].isupper():
+                    (io if '.' in n else famname).append(n)
+                elif n[0].islower():
+                    ed_func.append(n)
+            famname, io, ed_func = (
+                ' '.join(famname), ' '.join(io), ' '.join(ed_func))
+
+            self.fld(f'{fno}^a#{i+1}').fill(famname)
+            self.fld(f'{fno}^b#{i+1}').fill(io)
             if ed_func:
-                fld(f'{fno}^4#{i+1}').fill(
+                self.fld(f'{fno}^4#{i+1}').fill(
                     str(rusmarc.fcode.get(ed_func, 570)) + ed_func)
-            if 700 in irbis_entry and 701 in irbis_entry:
-                try:
-                    irbis_entry[701].contents.remove(
-                        irbis_entry[700].contents[1])
-                except ValueError:
-                    pass
+        if 700 in self.fields and 701 in self.fields:
+            field = self.fields[701]
+            try:
+                o = field.contents.index(self.fields[700].contents[1], 1)
+            except ValueError:
+                pass
+            else:
+                del field.contents[o]
+                for values in field.subf_list.values():
+                    del values[o - 1]
 
     def choose_mono_genre(self, title_info):
         mono_genre = {
@@ -274,31 +320,31 @@ class Parsing:
         }
 
         if title_info in mono_genre:
-            fld('900^c').fill(mono_genre[title_info])
+            self.fld('900^c').fill(mono_genre[title_info])
+
+
+def clean_bibref(bibref):
+    """normalise whitespace, dashes and ё in a bib.ref. before parsing"""
+    bibref = regex_multispace.sub(' ', bibref.strip(' \r\n\t'))
+    return bibref.translate(dashes_noyo).replace('.- ', '. - ')
 
 
-def fld(code):
-    """get or create a field object by an IRBIS-like designation
-    code is TAG^SUBF#OCC, like &uf('av900^A#1') in Irbis
-    place stores position in fields to communicate it between functions
-    #n makes new occurrences (does not work well: makes a new occ for every
-    subfield, use for fields with no subfields only, like 610)
+@lru_cache(maxsize=256)
+def parse_code(code):
+    """split an IRBIS-like designation TAG^SUBF#OCC into its parts
+    returns (tag, subfield, occ), occ is 'n' or an int
     """
-    global irbis_entry, place
     if '^' in code:
         v_tag = code[:code.find('^')]
     elif '#' in code:
         v_tag = code[:code.find('#')]
     else:
         v_tag = code
-    v_tag = int(v_tag)
-    field = irbis_entry[v_tag] if v_tag in irbis_entry else Field(v_tag)
     v_subf = code[code.index('^') + 1].upper() if '^' in code else '_'
     v_occ = code[code.index('#') + 1:] if '#' in code else 1
-    if v_occ == 'n':
-        v_occ = len(field.contents)
-    place = v_tag, int(v_occ), v_subf
-    return field
+    if v_occ != 'n':
+        v_occ = int(v_occ)
+    return int(v_tag), v_subf, v_occ
 
 
 def paste(form):
@@ -315,13 +361,21 @@ def paste(form):
         notify_text.set('В буфере обмена ничего не было.')
 
 
+def add_parsing(parsing):
+    """keep a finished parsing for saving and show it"""
+    parsing_batch.append(parsing)
+    parsing.show()
+    if parsing.latin_names:
+        notify_text.set('Имена латиницей, нужно будет исправить.')
+
+
 def do_parsing():
     """get a single bib.ref. from entry form and parse"""
     app.config(cursor='watch')
     try:
         notify_text.set('Разбираем...')
         paste(isbd_get_text)
-        Parsing(isbd_get_text.get('1.0', 'end'))
+        add_parsing(Parsing(isbd_get_text.get('1.0', 'end')))
         notify_text.set('Разобрано')
     except IndexError:
         notify_text.set('Нечего разбирать.')
@@ -332,15 +386,31 @@ def do_parsing():
 
 
 def multi_parsing():
-    """get many bib.refs. from text file and parse"""
+    """get many bib.refs. from text file and parse
+    bib.refs. are independent, so they are parsed in worker processes;
+    the file is read and submitted in batches of batch_size lines,
+    blank lines are skipped and lines that fail are reported by number
+    """
     filepath = askopenfilename(title='Выбор файла со ссылками',
                                initialdir=f'{app_dir}test_values',
                                defaultextension='txt')
     if filepath != '':
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            bibrefs = f.readlines()
-            for line in bibrefs:
-                Parsing(line)
+        failed = []
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f, \
+                ProcessPoolExecutor() as executor:
+            lines = ((no, line) for no, line in enumerate(f, 1)
+                     if line.strip())
+            while batch := list(islice(lines, batch_size)):
+                futures = [(no, executor.submit(Parsing, line))
+                           for no, line in batch]
+                for no, future in futures:
+                    try:
+                        add_parsing(future.result())
+                    except Exception:
+                        failed.append(str(no))
+        if failed:
+            notify_text.set(
+                f'Не удалось разобрать строки: {", ".join(failed)}')
 
 
 def save_irbis_text():
@@ -353,15 +423,17 @@ def save_irbis_text():
     if filepath != '':
         with open(filepath,
                   'w',
+                  buffering=1 << 20,
                   encoding='utf-8',
                   errors='ignore',
                   newline='\r\n') as f:
             for parsing in parsing_batch:
-                for field in parsing.fields.values():
-                    f.writelines(f'{line}\n'
-                                 for line in field.show('irbistext')
-                                 if len(line) > 6)
-                f.write('*****\n')
+                lines = [
+                    line for field in parsing.fields.values()
+                    for line in field.show('irbistext')
+                ]
+                lines.append('*****\n')
+                f.write('\n'.join(lines))
         app.destroy()
 
 
@@ -369,31 +441,32 @@ def readme():
     os.system(f'{app_dir}readme.txt')
 
 
-app = Tk()
-app.title('Разбираем ссылку для импорта в ИРБИС')
-
-up = Frame(app)
-paste_btn = Button(up,
-                   text='Вставить',
-                   command=lambda isbd_get_text: paste(isbd_get_text))
-workapart_btn = Button(up, text='Разобрать', command=do_parsing)
-fromfile_btn = Button(up, text='Разобрать из файла', command=multi_parsing)
-save_btn = Button(up,
-                  text='Сохранить в текст. файл ИРБИС',
-                  command=save_irbis_text)
-readme_btn = Button(up, text='readme', command=readme)
-isbd_get_text = Text(app, wrap='word', height=5)
-down = Frame(app)
-notify_text = StringVar()
-notify = Label(down, textvariable=notify_text)
-
-up.pack(pady=2, anchor=NW)
-paste_btn.pack(padx=2, side=LEFT)
-workapart_btn.pack(padx=2, side=LEFT)
-fromfile_btn.pack(padx=2, side=LEFT)
-save_btn.pack(padx=2, pady=1, side=LEFT)
-readme_btn.pack(padx=2, pady=1, side=LEFT)
-isbd_get_text.pack(padx=2, pady=1, anchor=NW)
-down.pack(pady=1, anchor=NW)
-notify.pack(padx=0, side=LEFT)
-app.mainloop()
+if __name__ == '__main__':
+    app = Tk()
+    app.title('Разбираем ссылку для импорта в ИРБИС')
+
+    up = Frame(app)
+    paste_btn = Button(up,
+                       text='Вставить',
+                       command=lambda isbd_get_text: paste(isbd_get_text))
+    workapart_btn = Button(up, text='Разобрать', command=do_parsing)
+    fromfile_btn = Button(up, text='Разобрать из файла', command=multi_parsing)
+    save_btn = Button(up,
+                      text='Сохранить в текст. файл ИРБИС',
+                      command=save_irbis_text)
+    readme_btn = Button(up, text='readme', command=readme)
+    isbd_get_text = Text(app, wrap='word', height=5)
+    down = Frame(app)
+    notify_text = StringVar()
+    notify = Label(down, textvariable=notify_text)
+
+    up.pack(pady=2, anchor=NW)
+    paste_btn.pack(padx=2, side=LEFT)
+    workapart_btn.pack(padx=2, side=LEFT)
+    fromfile_btn.pack(padx=2, side=LEFT)
+    save_btn.pack(padx=2, pady=1, side=LEFT)
+    readme_btn.pack(padx=2, pady=1, side=LEFT)
+    isbd_get_text.pack(padx=2, pady=1, anchor=NW)
+    down.pack(pady=1, anchor=NW)
+    notify.pack(padx=0, side=LEFT)
+    app.mainloop()
@@ -0,0 +1,96 @@
+"""
+Checks Parsing against the bib.refs. in test_bo.txt and against
+edge cases that the regexes have got wrong before.
+"""
+
+import os
+
+import pytest
+
+from main import Parsing, today
+
+here = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(here, 'test_bo.txt'), encoding='utf-8') as f:
+    test_bo = f.read().splitlines()
+
+stamp = f'#907: ^CПК^A{today}^Bitfmaker'
+
+
+def irbistext(bibref):
+    """parse a bib.ref. and return the lines of its import text"""
+    return [line for field in Parsing(bibref).fields.values()
+            for line in field.show('irbistext')]
+
+
+@pytest.mark.parametrize('bibref, expected', [
+    (test_bo[0], [
+        '#700: ^AЗолотарев^BА. А.',
+        '#200: ^AДистанционное обучение как инструмент повышения качества '
+        'обучения^Eдоклад^FА. А. Золотарев',
+        '#463: ^CИнтерактивные технологии и дистанционное обучение как '
+        'инструмент повышения качества образования^DСанкт-Петербург'
+        '^GСанкт-Петербургский государственный университет кино и '
+        'телевидения^J2014^1С.^S15-19',
+        '#963: ^Eсборник трудов V Международной научно-методической '
+        'конференции, Санкт-Петербург, 04 февраля 2014 года',
+        '#900: ^C18f^B09',
+        '#951: ^TСсылка на публикацию'
+        '^Ihttps://elibrary.ru/item.asp?edn=UIYTAA^H05',
+        '#920: ASP',
+        stamp]),
+    (test_bo[1], [
+        '#200: ^AДистрибьюция в кинематографии^Eучебное пособие'
+        '^FА. Д. Евменов, П. В. Данилов, Э. К. Какосьян, И. Н. Сахарова',
+        '#701: ^AЕвменов^BА. Д.',
+        '#701: ^AДанилов^BП. В.',
+        '#701: ^AКакосьян^BЭ. К.',
+        '#701: ^AСахарова^BИ. Н.',
+        '#210: ^AСПб.^CСПбГУКиТ^D2014',
+        '#900: ^B05',
+        '#215: ^A115^1с',
+        '#920: PAZK',
+        stamp]),
+], ids=['article', 'book'])
+def test_bo_file(bibref, expected):
+    assert irbistext(bibref) == expected
+
+
+def test_four_digit_page_count():
+    lines = irbistext('Иванов, И. И. Большая книга : монография / '
+                      'И. И. Иванов. - Москва : Наука, 2020. - 1024 с.')
+    assert '#215: ^A1024^1с.' in lines
+    assert not any(line.startswith('#463: ') for line in lines)
+
+
+def test_publisher_with_comma():
+    lines = irbistext('Петров, П. П. Сибирская книга / П. П. Петров. - '
+                      'Москва : Наука, Сибирское отделение, 2020. - 300 с.')
+    assert '#210: ^AМосква^CНаука, Сибирское отделение^D2020' in lines
+
+
+def test_year_followed_by_letter():
+    lines = irbistext('Книга / А. Б. Иванов. - М. : Наука, 2021г. - 100 с.')
+    assert '#210: ^AМ.^CНаука^D2021' in lines
+
+
+def test_doi_is_not_an_issue():
+    lines = irbistext('Сидоров, С. С. Статья / С. С. Сидоров // Журнал. - '
+                      '2019. - № 2. - С. 5-9. - DOI 10.1000/j.v.5.2019.')
+    assert '#463: ^CЖурнал^J2019^V№ 2^1С.^S5-9' in lines
+    assert '#19: ^A6 DOI^B10.1000/j.v.5.2019.' in lines
+
+
+def test_hyphenated_heading():
+    lines = irbistext('Римский-Корсаков, Н. А. Летопись моей музыкальной '
+                      'жизни / Н. А. Римский-Корсаков. - Москва : Музыка, '
+                      '1980. - 455 с.')
+    assert lines[:2] == [
+        '#700: ^AРимский-Корсаков^BН. А.',
+        '#200: ^AЛетопись моей музыкальной жизни^FН. А. Римский-Корсаков']
+    assert not any(line.startswith('#701: ') for line in lines)
+
+
+def test_field_order():
+    """900 comes after the publication area, as it always has"""
+    tags = [line.split(':')[0] for line in irbistext(test_bo[1])]
+    assert tags.index('#210') < tags.index('#900') < tags.index('#215')